@@ -163,6 +163,7 @@ class PickupAction(Action):
                     raise exceptions.Impossible("Your inventory is full.")
 
                 self.engine.game_map.entities.remove(item)
+                self.engine.game_map.invalidate_entity_positions()
                 item.parent = self._actor.inventory
                 inventory.items.append(item)
 
@@ -1,4 +1,4 @@
-from typing import Tuple, List
+from typing import Final, Tuple, List
 
 
 class Config:
@@ -142,3 +142,10 @@ class Config:
 
         POS_X = 21
         POS_Y = 44
+
+
+# Module-level aliases of the colors used on error paths (failed actions, invalid menu entries, in-game exceptions),
+# so they can be imported directly instead of being looked up through `Config.Color` on every use.
+IMPOSSIBLE_COLOR: Final = Config.Color.IMPOSSIBLE
+INVALID_COLOR: Final = Config.Color.INVALID
+ERROR_COLOR: Final = Config.Color.ERROR
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import lzma
 import pickle
 import random
+import zlib
 from typing import TYPE_CHECKING, Tuple, List, Optional, Set
 
 from tcod.console import Console
@@ -44,15 +44,21 @@ class Engine:
         players_turn = False
 
         #TODO: Might cause bugs to have an arbitrarily long while-loop here
+        ticker = self.ticker
         while not players_turn:
 
-            actors = self.ticker.next_turn()  # Get a list of any actors who are scheduled for this tick
+            # Skip straight to the next tick where someone is scheduled, nothing happens on the ticks in between.
+            next_tick = ticker.peek_next_tick()
+            if next_tick is not None and next_tick > ticker.ticks:
+                ticker.ticks = next_tick
+
+            actors = ticker.next_turn()  # Get a list of any actors who are scheduled for this tick
 
             for actor in actors:
                 if actor.is_alive:
                     if actor == self.player:
                         # Schedule the player's next turn.
-                        self.ticker.schedule_turn(actor.energy.speed, actor)
+                        ticker.schedule_turn(actor.energy.speed, actor)
                         players_turn = True
                     else:
                         if actor.parent != self.game_map:
@@ -66,9 +72,9 @@ class Engine:
                         if not self.player.is_alive:
                             players_turn = True
                             break
-                        self.ticker.schedule_turn(actor.energy.speed, actor)
+                        ticker.schedule_turn(actor.energy.speed, actor)
 
-            self.ticker.ticks += 1  # Increment the time
+            ticker.ticks += 1  # Increment the time
 
     def update_fov(self) -> None:
         """Recompute the field of vision (visible area) based on the player's point of view."""
@@ -82,7 +88,7 @@ class Engine:
 
     def save_as(self, file_name: str) -> None:
         """Save this Engine instance as a compressed file."""
-        save_data = lzma.compress(pickle.dumps(self))
+        save_data = zlib.compress(pickle.dumps(self))
         with open(file_name, "wb") as f:
             f.write(save_data)
 
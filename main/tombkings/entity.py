@@ -54,6 +54,7 @@ class Entity:
             # If parent isn't provided now then it will be set later.
             self.parent = parent
             parent.entities.add(self)
+            parent.invalidate_entity_positions()
 
     def copy_to(self: T, game_map: GameMap, x: int, y: int) -> T:
         """Make a copy ('spawn') of this instance at the given location."""
@@ -72,13 +73,21 @@ class Entity:
             if hasattr(self, "parent"):  # Possibly not initialized.
                 if self.parent is self.game_map:
                     self.game_map.entities.remove(self)
+                    self.game_map.invalidate_entity_positions()
 
             self.parent = game_map
             game_map.entities.add(self)
+        self._invalidate_map_positions()
 
     def move(self, dx: int, dy: int) -> None:
         self._x += dx
         self._y += dy
+        self._invalidate_map_positions()
+
+    def _invalidate_map_positions(self) -> None:
+        """Let the game map this entity is on know that where its entities are, or what they are called, changed."""
+        if hasattr(self, "parent"):  # Possibly not initialized.
+            self.game_map.invalidate_entity_positions()
 
     def distance_to(self, x: int, y: int) -> float:
         """Return the distance between this entity and the specified x,y-coordinate."""
@@ -91,6 +100,7 @@ class Entity:
     @x.setter
     def x(self, val: int) -> None:
         self._x = val
+        self._invalidate_map_positions()
 
     @property
     def y(self) -> int:
@@ -99,6 +109,7 @@ class Entity:
     @y.setter
     def y(self, val: int) -> None:
         self._y = val
+        self._invalidate_map_positions()
 
     @property
     def char(self) -> str:
@@ -127,6 +138,7 @@ class Entity:
     @name.setter
     def name(self, val: str) -> None:
         self._name = val
+        self._invalidate_map_positions()  # The names shown for this entity's tile are cached by the map.
 
     @property
     def blocks_movement(self) -> bool:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable, Iterator, Set, Optional, TYPE_CHECKING, Tuple
+from typing import Dict, Iterable, Iterator, List, Set, Optional, TYPE_CHECKING, Tuple
 
 import numpy as np  # type: ignore
 from tcod.console import Console
@@ -30,6 +30,27 @@ class GameMap:
         self._downstairs_location = (0, 0)
 
         self._entities = set(entities)
+        # The entities grouped by their coordinates, rebuilt when needed after they change.
+        self._entity_positions: Optional[Dict[Tuple[int, int], List[Entity]]] = None
+        # The names shown for coordinates the mouse has been over, cleared together with the entity positions.
+        self._names_at: Dict[Tuple[int, int], str] = {}
+        # The light, dark and SHROUD graphics in the console's tile layout, built on first render.
+        self._tile_graphics: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def __getstate__(self):
+        """Leave the cached data out of saves, it is rebuilt when needed."""
+        state = self.__dict__.copy()
+        state["_entity_positions"] = None
+        state["_names_at"] = {}
+        state["_tile_graphics"] = None
+        return state
+
+    def __setstate__(self, state):
+        """Restore a pickled map. Its caches start out empty, as they are missing from saves made before they existed."""
+        self.__dict__.update(state)
+        self._entity_positions = None
+        self._names_at = {}
+        self._tile_graphics = None
 
     @property
     def engine(self) -> Engine:
@@ -74,6 +95,24 @@ class GameMap:
     def entities(self) -> Set[Entity]:
         return self._entities
 
+    @property
+    def entity_positions(self) -> Dict[Tuple[int, int], List[Entity]]:
+        """
+        The entities on this map keyed by their (x, y)-coordinates. Only coordinates with entities on them are keys.
+        Built on first use after `invalidate_entity_positions` has been called.
+        """
+        if self._entity_positions is None:
+            positions: Dict[Tuple[int, int], List[Entity]] = {}
+            for entity in self._entities:
+                positions.setdefault((entity.x, entity.y), []).append(entity)
+            self._entity_positions = positions
+        return self._entity_positions
+
+    def invalidate_entity_positions(self) -> None:
+        """Call this after entities on the map have moved, been added or been removed."""
+        self._entity_positions = None
+        self._names_at.clear()
+
     @property
     def game_map(self) -> GameMap:
         return self
@@ -92,6 +131,7 @@ class GameMap:
 
     def add_and_register_entity(self, entity: Entity):
         self._entities.add(entity)
+        self.invalidate_entity_positions()
         if isinstance(entity, Actor) and entity.ai and entity.energy:
             self.engine.ticker.schedule_turn(entity.energy.speed, entity)
 
@@ -106,10 +146,12 @@ class GameMap:
         If it is not in 'visible' but is in 'explored', draw it with 'dark' colors.
         Otherwise, the default is 'SHROUD'.
         """
-        console.tiles_rgb[0:self._width, 0:self._height] = np.select(
+        tiles_rgb = console.tiles_rgb[0:self._width, 0:self._height]
+        light, dark, shroud = self._get_tile_graphics(tiles_rgb.dtype)
+        tiles_rgb.view(light.dtype)[...] = np.select(
             condlist=[self._visible_tiles, self._explored_tiles],
-            choicelist=[self._tiles["light"], self._tiles["dark"]],
-            default=tile_types.SHROUD,
+            choicelist=[light, dark],
+            default=shroud,
         )
 
         # Render entities in the correct order
@@ -119,6 +161,39 @@ class GameMap:
             if self._visible_tiles[entity.x, entity.y]:
                 console.print(x=entity.x, y=entity.y, string=entity.char, fg=entity.color)
 
+    def _get_tile_graphics(self, rgb_dtype: np.dtype) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the light and dark graphics of this map's tiles, and the SHROUD graphic, converted to `rgb_dtype` (the
+        layout of Console.tiles_rgb) and viewed as raw bytes. NumPy selects and copies raw bytes a whole tile at a
+        time, rather than field by field as with structured arrays, which makes rendering the map several times faster.
+        Built on first use, since the tiles of a map don't change after it has been generated.
+        """
+        if self._tile_graphics is None:
+            raw_dtype = np.dtype((np.void, rgb_dtype.itemsize))
+
+            def convert(graphics: np.ndarray) -> np.ndarray:
+                converted = np.zeros(graphics.shape, dtype=rgb_dtype, order="F")  # Zeroes any padding bytes.
+                for field in ("ch", "fg", "bg"):
+                    converted[field] = graphics[field]
+                return converted.view(raw_dtype)
+
+            self._tile_graphics = (
+                convert(self._tiles["light"]), convert(self._tiles["dark"]), convert(tile_types.SHROUD)
+            )
+        return self._tile_graphics
+
+    def get_entities_at(self, pos_x: int, pos_y: int) -> List[Entity]:
+        """Return all entities at the given coordinates."""
+        return self.entity_positions.get((pos_x, pos_y), [])
+
+    def get_names_at(self, pos_x: int, pos_y: int) -> str:
+        """Return the names of all entities at the given coordinates as one capitalized, comma separated string."""
+        names = self._names_at.get((pos_x, pos_y))
+        if names is None:
+            names = ", ".join(entity.name for entity in self.get_entities_at(pos_x, pos_y)).capitalize()
+            self._names_at[pos_x, pos_y] = names
+        return names
+
     def get_blocking_entity_at(self, pos_x: int, pos_y: int) -> Optional[Entity]:
         for entity in self._entities:
             if (
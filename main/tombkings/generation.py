@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import random
 from abc import ABC, abstractmethod
-from typing import Iterator, Tuple, List, TYPE_CHECKING, Dict, Optional
+from typing import Iterator, Tuple, List, TYPE_CHECKING, Dict, Optional, Union
 
-import tcod
 import numpy as np
 from collections import deque
+from itertools import accumulate
 
 import tile_types
 
@@ -41,19 +41,27 @@ MONSTER_CHANCES: Dict[int, List[Tuple[Entity, int]]] = {
 }
 
 
-class MapGenerator:
+_VECTORIZED_PICK_THRESHOLD = 8
+"""Picking at least this many entities at once draws them all with NumPy. Below it, the overhead of calling into NumPy
+outweighs the cost of `random.choices` doing one bisect per pick."""
 
-    @staticmethod
-    def pick_entities_randomly(
-            weighted_chances_by_floor: Dict[int, List[Tuple[Entity, int]]],
-            num_choices: int,
-            floor: int,
-    ) -> List[Entity]:
-        """Select `num_choices` entities randomly using weights that depend on the dungeon floor."""
+_TABLE_CACHE: Dict[Tuple[int, int], Tuple[List[Entity], List[int], np.ndarray, np.ndarray]] = {}
+"""Cache of the entities that can spawn and their cumulative weights (both as lists and as arrays), keyed by (id of
+chance table, floor). The chance tables above are module constants, so a table only has to be walked once per floor
+and the result is shared by every map generator."""
+
+
+def _get_table(
+        weighted_chances_by_floor: Dict[int, List[Tuple[Entity, int]]], floor: int
+) -> Tuple[List[Entity], List[int], np.ndarray, np.ndarray]:
+    """Return the entities that can spawn on `floor` along with their cumulative weights."""
+    key = (id(weighted_chances_by_floor), floor)
+    table = _TABLE_CACHE.get(key)
+    if table is None:
         # Store the entities that can spawn on the current floor and their weights in a dictionary.
         entity_weights: Dict[Entity, int] = {}
-        for key, values in weighted_chances_by_floor.items():
-            if key > floor:  # The minimum floor that something can spawn is higher than the current `floor`.
+        for min_floor, values in weighted_chances_by_floor.items():
+            if min_floor > floor:  # The minimum floor that something can spawn is higher than the current `floor`.
                 break
             else:
                 for value in values:
@@ -61,11 +69,48 @@ class MapGenerator:
                     entity_weights[entity] = weight  # Populate our list of possible things that can spawn.
 
         possible_entities = list(entity_weights.keys())
-        chances = list(entity_weights.values())
-        chosen_entities = random.choices(
-            possible_entities, weights=chances, k=num_choices
+        cumulative_chances = list(accumulate(entity_weights.values()))
+
+        entity_array = np.empty(len(possible_entities), dtype=object)
+        entity_array[:] = possible_entities
+        table = (
+            possible_entities,
+            cumulative_chances,
+            entity_array,
+            np.array(cumulative_chances, dtype=np.float64),
         )
-        return chosen_entities
+        _TABLE_CACHE[key] = table
+    return table
+
+
+def _pick(
+        weighted_chances_by_floor: Dict[int, List[Tuple[Entity, int]]],
+        num_choices: int,
+        floor: int,
+) -> List[Entity]:
+    """Select `num_choices` entities randomly using weights that depend on the dungeon floor."""
+    possible_entities, cumulative_chances, entity_array, cumulative_array = _get_table(
+        weighted_chances_by_floor, floor
+    )
+    if num_choices < _VECTORIZED_PICK_THRESHOLD:
+        return random.choices(possible_entities, cum_weights=cumulative_chances, k=num_choices)
+
+    # Draw all the picks at once and find where they land on the cumulative weights with one binary search pass.
+    draws = np.random.random(num_choices) * cumulative_array[-1]
+    indices = np.searchsorted(cumulative_array, draws, side="right")
+    return entity_array[indices].tolist()
+
+
+class MapGenerator:
+
+    @staticmethod
+    def pick_entities_randomly(
+            weighted_chances_by_floor: Dict[int, List[Tuple[Entity, int]]],
+            num_choices: int,
+            floor: int,
+    ) -> List[Entity]:
+        """Select `num_choices` entities randomly using weights that depend on the dungeon floor."""
+        return _pick(weighted_chances_by_floor, num_choices, floor)
 
 
 class BasicRectangular(MapGenerator):
@@ -90,16 +135,23 @@ class BasicRectangular(MapGenerator):
         dungeon = GameMap(self.engine, self.map_width, self.map_height, entities=[player])
 
         rooms: List[Rectangle] = []
-        center_of_last_room: Tuple[int, int] = (0, 0)
+
+        # Bind the names used on every iteration to locals, to skip the global and attribute lookups in the loop.
+        randint = random.randint
+        floor_index = tile_types.FLOOR_INDEX
+        # Dig the map out as indices into the tile table, which are much smaller to write than whole tiles.
+        tile_indices = np.full(
+            (dungeon.width, dungeon.height), fill_value=tile_types.WALL_INDEX, dtype=np.int8, order="F"
+        )
 
         for r in range(self.max_rooms):
 
             # Make a new room with random dimensions.
-            room_width = random.randint(self.room_min_size, self.room_max_size)
-            room_height = random.randint(self.room_min_size, self.room_max_size)
+            room_width = randint(self.room_min_size, self.room_max_size)
+            room_height = randint(self.room_min_size, self.room_max_size)
 
-            x = random.randint(0, dungeon.width - room_width - 1)
-            y = random.randint(0, dungeon.height - room_height - 1)
+            x = randint(0, dungeon.width - room_width - 1)
+            y = randint(0, dungeon.height - room_height - 1)
 
             new_room = Rectangle(x, y, room_width, room_height)
 
@@ -107,7 +159,7 @@ class BasicRectangular(MapGenerator):
             if any(new_room.intersects(other_room) for other_room in rooms):
                 continue
 
-            dungeon.tiles[new_room.inner] = tile_types.FLOOR
+            tile_indices[new_room.inner] = floor_index
 
             if len(rooms) == 0:
                 # The first room, where the player starts
@@ -117,16 +169,18 @@ class BasicRectangular(MapGenerator):
                 # Generate some entities.
                 BasicRectangular.__place_entities(new_room, dungeon, self.engine.game_world.current_floor)
                 # Dig out a tunnel between this room and the previous one.
-                for x, y in BasicRectangular.__tunnel_between(rooms[-1].center, new_room.center):
-                    dungeon.tiles[x, y] = tile_types.FLOOR
+                for segment in BasicRectangular.__tunnel_between(rooms[-1].center, new_room.center):
+                    tile_indices[segment] = floor_index
 
-                center_of_last_room = new_room.center
+            rooms.append(new_room)
 
+        if rooms:
             # Add the stair down to the last room created.
-            dungeon.tiles[center_of_last_room] = tile_types.DOWN_STAIRS
+            center_of_last_room = rooms[-1].center
+            tile_indices[center_of_last_room] = tile_types.DOWN_STAIRS_INDEX
             dungeon.downstairs_location = center_of_last_room
 
-            rooms.append(new_room)
+        tile_types.fill_tiles(dungeon.tiles, tile_indices)
 
         return dungeon
 
@@ -147,9 +201,10 @@ class BasicRectangular(MapGenerator):
             ITEM_CHANCES, num_items, floor_number
         )
 
+        randint = random.randint
         for entity in monsters + items:
-            x = random.randint(room.x1 + 1, room.x2 - 1)
-            y = random.randint(room.y1 + 1, room.y2 - 1)
+            x = randint(room.x1 + 1, room.x2 - 1)
+            y = randint(room.y1 + 1, room.y2 - 1)
             if not any(entity.x == x and entity.y == y for entity in dungeon.entities):
                 entity.copy_to(dungeon, x, y)
 
@@ -168,8 +223,10 @@ class BasicRectangular(MapGenerator):
         return current
 
     @staticmethod
-    def __tunnel_between(start: Tuple[int, int], end: Tuple[int, int]) -> Iterator[Tuple[int, int]]:
-        """Return an L-shaped tunnel between two points."""
+    def __tunnel_between(
+            start: Tuple[int, int], end: Tuple[int, int]
+    ) -> Iterator[Tuple[Union[int, slice], Union[int, slice]]]:
+        """Return an L-shaped tunnel between two points as the 2D array indices of its two straight segments."""
         x1, y1 = start
         x2, y2 = end
         if random.random() < 0.5:
@@ -179,12 +236,18 @@ class BasicRectangular(MapGenerator):
             # Move vertically, then horizontally.
             corner_x, corner_y = x1, y2
 
-        # Generate the coordinates for the tunnel using Bresenham's line algorithm.
-        for x, y in tcod.los.bresenham((x1, y1), (corner_x, corner_y)).tolist():
-            yield x, y
+        # Both segments are axis-aligned, so each one can be dug out with a single slice assignment.
+        yield BasicRectangular.__segment((x1, y1), (corner_x, corner_y))
+        yield BasicRectangular.__segment((corner_x, corner_y), (x2, y2))
 
-        for x, y in tcod.los.bresenham((corner_x, corner_y), (x2, y2)).tolist():
-            yield x, y
+    @staticmethod
+    def __segment(start: Tuple[int, int], end: Tuple[int, int]) -> Tuple[Union[int, slice], Union[int, slice]]:
+        """Return the 2D array index of the horizontal or vertical line between two points (inclusive)."""
+        x1, y1 = start
+        x2, y2 = end
+        if y1 == y2:
+            return slice(min(x1, x2), max(x1, x2) + 1), y1
+        return x1, slice(min(y1, y2), max(y1, y2) + 1)
 
 
 class CellularAutomata(MapGenerator):
@@ -200,28 +263,31 @@ class CellularAutomata(MapGenerator):
         self.engine: Engine = engine
         self.percent_walls: int = percent_walls
 
-        # Initialize map filled with floor/walkable tiles
-        self.internal_map: np.ndarray = np.zeros(
-            (self.map_width, self.map_height),
+        # Initialize map filled with floor/walkable tiles, surrounded by a permanent two tile thick border of walls.
+        # Neighbour lookups read the padded array (offset by 2), so they never need a bounds check.
+        self._padded: np.ndarray = np.ones(
+            (self.map_width + 4, self.map_height + 4),
             dtype=np.int8,
             order="F"
         )
+        self._padded[2:-2, 2:-2] = 0
+        self.internal_map: np.ndarray = self._padded[2:-2, 2:-2]
 
     def generate_map(self) -> GameMap:
         self.__random_fill()
         for _ in range(4):
-            self.internal_map = self.__next_gen(0)
+            self.internal_map[:] = self.__next_gen(0)
         for _ in range(3):
-            self.internal_map = self.__next_gen(1)
+            self.internal_map[:] = self.__next_gen(1)
 
         self.__flood_fill_test()
 
         # Create external map from representation
         dungeon = GameMap(self.engine, self.map_width, self.map_height, [self.engine.player])
-        for x in range(self.map_width):
-            for y in range(self.map_height):
-                if self.internal_map[x, y] == 2:
-                    dungeon.tiles[x, y] = tile_types.FLOOR
+        # Both arrays are indexed [x, y], so the flood-filled cells can be used directly to pick tiles from the table.
+        tile_types.fill_tiles(
+            dungeon.tiles, np.where(self.internal_map == 2, tile_types.FLOOR_INDEX, tile_types.WALL_INDEX)
+        )
 
         dungeon = self.__place_entities(dungeon, self.engine.game_world.current_floor)
         return dungeon
@@ -237,22 +303,17 @@ class CellularAutomata(MapGenerator):
             ITEM_CHANCES, max_items, floor_number
         )
 
-        spawn_tries = 3
+        # Shuffle every floor tile once and hand them out in turn, so each entity gets a distinct free tile without
+        # rejection sampling. The player is placed first so that there is always room for them.
+        floor_coords: List[Tuple[int, int]] = list(map(tuple, np.argwhere(dungeon.tiles == tile_types.FLOOR).tolist()))
+        random.shuffle(floor_coords)
+
+        self.engine.player.place(*floor_coords.pop(), dungeon)
+
         for entity in monsters + items:
-            for _ in range(spawn_tries):
-                x = random.randint(1, self.map_width - 1)
-                y = random.randint(1, self.map_height - 1)
-                if dungeon.tiles[x, y] == tile_types.FLOOR \
-                        and not any(e.x == x and e.y == y for e in dungeon.entities):
-                    entity.copy_to(dungeon, x, y)
-
-        player_place_tries = 99
-        for _ in range(player_place_tries):
-            x = random.randint(1, self.map_width - 1)
-            y = random.randint(1, self.map_height - 1)
-            if dungeon.tiles[x, y] == tile_types.FLOOR \
-                    and not any(e.x == x and e.y == y for e in dungeon.entities):
-                self.engine.player.place(x, y, dungeon)
+            if not floor_coords:
+                break  # The map is full.
+            entity.copy_to(dungeon, *floor_coords.pop())
 
         return dungeon
 
@@ -267,20 +328,21 @@ class CellularAutomata(MapGenerator):
             raise OverflowError("Could not find open tile to start flood fill (max tries reached)")
         adjacencies = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
         num_filled_tiles = 0
+        # Fill in padded coordinates: the wall border is never 0, so the fill can never step outside the array.
+        padded = self._padded
         q = deque()
-        q.append((start_x, start_y))
+        push, pop = q.append, q.pop  # Bound once, these run for every tile that is filled.
+        push((start_x + 2, start_y + 2))
         while q: # While queue is not empty
-            next_x, next_y = q.pop()
-            if not self.__out_of_bounds(next_x, next_y):
-                if self.internal_map[next_x, next_y] == 0:
-                    self.internal_map[next_x, next_y] = 2
+            next_x, next_y = pop()
+            if padded[next_x, next_y] == 0:
+                padded[next_x, next_y] = 2
+                num_filled_tiles += 1
+            for i, j in adjacencies:
+                if padded[next_x + i, next_y + j] == 0:
+                    padded[next_x + i, next_y + j] = 2
                     num_filled_tiles += 1
-                for i, j in adjacencies:
-                    if not self.__out_of_bounds(next_x + i, next_y + j):
-                        if self.internal_map[next_x + i, next_y + j] == 0:
-                            self.internal_map[next_x + i, next_y + j] = 2
-                            num_filled_tiles += 1
-                            q.append((next_x + i, next_y + j))
+                    push((next_x + i, next_y + j))
 
         if num_filled_tiles / (self.map_width * self.map_height) >= 0.45:
             # Test passed, more than 45% of map is walkable
@@ -288,78 +350,59 @@ class CellularAutomata(MapGenerator):
 
     def __next_gen(self, logic_mode: int) -> np.ndarray:
         assert logic_mode == 0 or logic_mode == 1, "Logic mode for cellular automata not found."
+        # The padding counts as wall (out of bounds is considered a wall), so the wall count around every cell can
+        # be computed for the whole map at once.
+        walls: np.ndarray = self._padded == 1
+
+        if logic_mode == 0:
+            place_wall = self.__place_wall_logic_primary(walls)
+        else:
+            place_wall = self.__place_wall_logic_secondary(walls)
+
         next_map: np.ndarray = np.zeros(
             (self.map_width, self.map_height),
             dtype=np.int8,
             order="F"
         )
-        if logic_mode == 0:
-            for x in range(self.map_width):
-                for y in range(self.map_height):
-                    next_map[x, y] = self.__place_wall_logic_primary(x, y)
-        else:
-            for x in range(self.map_width):
-                for y in range(self.map_height):
-                    next_map[x, y] = self.__place_wall_logic_secondary(x, y)
-
+        next_map[place_wall] = 1
         return next_map
 
     def __random_fill(self) -> None:
-        for x in range(self.map_width):
-            for y in range(self.map_height):
-                # Create a border on the edge of the map
-                if x == 0 or y == 0 or x == self.map_width - 1 or y == self.map_height - 1:
-                    self.internal_map[x, y] = 1
-
-                else:
-                    chance = random.randint(1, 100)
-                    if chance <= self.percent_walls:
-                        self.internal_map[x, y] = 1
-                    else:
-                        self.internal_map[x, y] = 0
-
-    def __place_wall_logic_primary(self, x: int, y: int) -> int:
+        # Draw the chance for every cell at once, then create a border on the edge of the map.
+        chance = np.random.randint(1, 101, size=(self.map_width, self.map_height))
+        self.internal_map[:] = chance <= self.percent_walls
+        self.internal_map[[0, -1], :] = 1
+        self.internal_map[:, [0, -1]] = 1
+
+    def __place_wall_logic_primary(self, walls: np.ndarray) -> np.ndarray:
         """Handle the cellular automata logic for next generation"""
-        adj_1_walls: int = self.__get_nearby_wall_count(x, y, 1, 1)
-        adj_2_walls: int = self.__get_nearby_wall_count(x, y, 2, 2)
+        adj_1_walls: np.ndarray = self.__get_nearby_wall_count(walls, 1)
+        adj_2_walls: np.ndarray = self.__get_nearby_wall_count(walls, 2)
 
-        if adj_1_walls >= 5 or adj_2_walls <= 2:
-            return 1
-        return 0
+        return (adj_1_walls >= 5) | (adj_2_walls <= 2)
 
-    def __place_wall_logic_secondary(self, x: int, y: int) -> int:
-        adj_1_walls: int = self.__get_nearby_wall_count(x, y, 1, 1)
+    def __place_wall_logic_secondary(self, walls: np.ndarray) -> np.ndarray:
+        adj_1_walls: np.ndarray = self.__get_nearby_wall_count(walls, 1)
 
-        if adj_1_walls >= 5:
-            return 1
-        return 0
+        return adj_1_walls >= 5
 
-    def __get_nearby_wall_count(self, x: int, y: int, scope_x: int, scope_y: int) -> int:
-        start_x: int = x - scope_x
-        start_y: int = y - scope_y
-        end_x: int = x + scope_x
-        end_y: int = y + scope_y
+    def __get_nearby_wall_count(self, walls: np.ndarray, scope: int) -> np.ndarray:
+        """Return the number of walls within `scope` tiles of every cell (including the cell itself).
+        `walls` is the wall mask of the map padded by two tiles on each side."""
+        start: int = 2 - scope
+        size: int = 2 * scope + 1
 
-        wall_counter: int = 0
+        # The square window sum is separable: sum the columns of the window first, then the rows.
+        column_sums: np.ndarray = np.zeros((self.map_width, self.map_height + 4), dtype=np.int8)
+        for i in range(start, start + size):
+            column_sums += walls[i:i + self.map_width, :]
 
-        for ix in range(start_x, end_x + 1):
-            for iy in range(start_y, end_y + 1):
-                if self.__is_wall(ix, iy):
-                    wall_counter += 1
+        wall_counter: np.ndarray = np.zeros((self.map_width, self.map_height), dtype=np.int8)
+        for j in range(start, start + size):
+            wall_counter += column_sums[:, j:j + self.map_height]
 
         return wall_counter
 
-    def __is_wall(self, x: int, y: int):
-        # Consider out of bounds a wall
-        if self.__out_of_bounds(x, y):
-            return True
-        if self.internal_map[x, y] == 1:
-            return True
-        return False
-
-    def __out_of_bounds(self, x: int, y: int):
-        return not (0 <= x < self.map_width and 0 <= y < self.map_height)
-
     def __str__(self):
         string: str = " ".join([
             "Width:",
@@ -387,46 +430,40 @@ class CellularAutomata(MapGenerator):
 class Rectangle:
     """Simple class to represent a rectangular room in a dungeon."""
 
+    # Rooms are created in bulk during map generation and only ever read afterwards, so the corners are stored as
+    # plain slots (no property indirection) and the derived values are computed once on first access.
+    __slots__ = ("x1", "y1", "x2", "y2", "_center", "_inner")
+
     def __init__(self, x: int, y: int, width: int, height: int):
-        self._x1 = x
-        self._y1 = y
-        self._x2 = x + width
-        self._y2 = y + height
+        self.x1 = x
+        self.y1 = y
+        self.x2 = x + width
+        self.y2 = y + height
+        self._center: Optional[Tuple[int, int]] = None
+        self._inner: Optional[Tuple[slice, slice]] = None
 
     @property
     def center(self) -> Tuple[int, int]:
         """Find the coordinates of the center of the room."""
-        center_x = int((self._x1 + self._x2) / 2)
-        center_y = int((self._y1 + self._y2) / 2)
+        if self._center is None:
+            center_x = int((self.x1 + self.x2) / 2)
+            center_y = int((self.y1 + self.y2) / 2)
+            self._center = center_x, center_y
 
-        return center_x, center_y
+        return self._center
 
     @property
     def inner(self) -> Tuple[slice, slice]:
         """Return the inner area of this room as a 2D array index."""
-        return slice(self._x1 + 1, self._x2), slice(self._y1 + 1, self._y2)
-
-    @property
-    def y2(self):
-        return self._y2
-
-    @property
-    def x2(self):
-        return self._x2
-
-    @property
-    def x1(self):
-        return self._x1
-
-    @property
-    def y1(self):
-        return self._y1
+        if self._inner is None:
+            self._inner = slice(self.x1 + 1, self.x2), slice(self.y1 + 1, self.y2)
+        return self._inner
 
     def intersects(self, other: Rectangle) -> bool:
         """Return True if this rectangle overlaps with another."""
         return (
-                self._x1 <= other._x2
-                and self._x2 >= other._x1
-                and self._y1 <= other._y2
-                and self._y2 >= other._y1
+                self.x1 <= other.x2
+                and self.x2 >= other.x1
+                and self.y1 <= other.y2
+                and self.y2 >= other.y1
         )
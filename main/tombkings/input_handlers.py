@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import os
-from typing import Optional, TYPE_CHECKING, Callable, Tuple, Union
+from typing import Any, Optional, TYPE_CHECKING, Callable, Dict, Final, NoReturn, Tuple, Union
 from overrides import overrides
 
+import numpy as np
 import tcod.event
 
 import actions
 from actions import Action, BumpAction, WaitAction, PickupAction
 import exceptions
-from config import Config as cfg
+from config import Config as cfg, IMPOSSIBLE_COLOR, INVALID_COLOR
 
 if TYPE_CHECKING:
     from components.spell import Spell
@@ -46,16 +47,25 @@ MOVE_KEYS = {
     tcod.event.K_n: (1, 1),
 }
 
-WAIT_KEYS = {
+WAIT_KEYS = frozenset({
     tcod.event.K_PERIOD,
     tcod.event.K_KP_5,
     tcod.event.K_CLEAR,
-}
+})
 
-CONFIRM_KEYS = {
+CONFIRM_KEYS = frozenset({
     tcod.event.K_RETURN,
     tcod.event.K_KP_ENTER
-}
+})
+
+MODIFIER_KEYS = frozenset({
+    tcod.event.K_LSHIFT,
+    tcod.event.K_RSHIFT,
+    tcod.event.K_LCTRL,
+    tcod.event.K_RCTRL,
+    tcod.event.K_LALT,
+    tcod.event.K_RALT,
+})
 
 # Other actions and menus
 
@@ -72,6 +82,35 @@ SPELL_MENU_KEY = tcod.event.K_z
 
 DEBUG_CONSOLE_KEY = tcod.event.K_t
 
+LETTER_KEYS = {tcod.event.K_a + i: i for i in range(26)}
+"""The index of the menu entry selected by each of the letter keys a-z."""
+
+MENU_LETTER_PREFIXES = tuple(f"({chr(ord('a') + i)}) " for i in range(26))
+"""The "(a) ", "(b) ", ... prefixes of the entries in selection menus, indexed by entry."""
+
+INVALID_ENTRY_TEXT: Final = "Invalid entry."
+
+LEVEL_UP_OPTION_CONSTITUTION: Final = "(a) Constitution (increase max health)"
+LEVEL_UP_OPTION_STRENGTH: Final = "(b) Strength (increase attack power)"
+
+_SHIFT_MASK = tcod.event.KMOD_LSHIFT | tcod.event.KMOD_RSHIFT
+_CTRL_MASK = tcod.event.KMOD_LCTRL | tcod.event.KMOD_RCTRL
+_ALT_MASK = tcod.event.KMOD_LALT | tcod.event.KMOD_RALT
+
+MOVE_KEY_SCALED = {
+    key: tuple(
+        (dx * scale, dy * scale)
+        for scale in (
+            (5 if index & 1 else 1) * (10 if index & 2 else 1) * (20 if index & 4 else 1) for index in range(8)
+        )
+    )
+    for key, (dx, dy) in MOVE_KEYS.items()
+}
+"""
+The movement of each of the MOVE_KEYS when selecting an index, indexed by the held modifier keys: bit 0 is shift
+(5 times larger steps), bit 1 is ctrl (10 times) and bit 2 is alt (20 times), so holding all three moves 1000 tiles.
+"""
+
 CURSOR_Y_KEYS = {
     tcod.event.K_UP: -1,
     tcod.event.K_DOWN: 1,
@@ -89,7 +128,28 @@ MainEventHandler will become the active handler.
 """
 
 
+def _clamp_move(x: int, y: int, dx: int, dy: int, width: int, height: int) -> Tuple[int, int]:
+    """Move the position (x, y) by (dx, dy), clamped to an area of the given size."""
+    x += dx
+    y += dy
+    return max(0, min(x, width - 1)), max(0, min(y, height - 1))
+
+
+def _scroll_cursor(cursor: int, adjust: int, length: int) -> int:
+    """Move a cursor over `length` lines by `adjust` lines. The cursor wraps around only when it is already on the
+    edge it is moving past, otherwise it is clamped to the first or last line."""
+    if adjust < 0 and cursor == 0:
+        # Only move from the top to the bottom when you are on the edge.
+        return length - 1
+    elif adjust > 0 and cursor == length - 1:
+        # Same with bottom to top movement.
+        return 0
+    # Otherwise move while staying clamped to the bounds.
+    return max(0, min(cursor + adjust, length - 1))
+
+
 class BaseEventHandler(tcod.event.EventDispatch[ActionOrHandler]):
+    __slots__ = ()
 
     def handle_events(self, event: tcod.event.Event) -> BaseEventHandler:
         """Handle an event and return the next active event handler."""
@@ -99,6 +159,17 @@ class BaseEventHandler(tcod.event.EventDispatch[ActionOrHandler]):
         assert not isinstance(state, Action), f"{self!r} can not handle actions."
         return self
 
+    @overrides
+    def dispatch(self, event: Any) -> Optional[ActionOrHandler]:
+        """Send an event to an `ev_*` method. Mouse motion and key presses, by far the most frequent events, are sent
+        directly instead of looking up the method by the event's type name."""
+        event_type = type(event)
+        if event_type is tcod.event.MouseMotion:
+            return self.ev_mousemotion(event)
+        if event_type is tcod.event.KeyDown:
+            return self.ev_keydown(event)
+        return super().dispatch(event)
+
     def on_render(self, console: tcod.Console) -> None:
         raise NotImplementedError()
 
@@ -108,9 +179,11 @@ class BaseEventHandler(tcod.event.EventDispatch[ActionOrHandler]):
 
 
 class EventHandler(BaseEventHandler):
+    __slots__ = ("_engine", "_player")
 
     def __init__(self, engine: Engine):
         self._engine = engine
+        self._player = engine.player  # The engine keeps the same player for its lifetime.
 
     @overrides
     def handle_events(self, event: tcod.event.Event) -> BaseEventHandler:
@@ -120,12 +193,16 @@ class EventHandler(BaseEventHandler):
             return action_or_state
         if self.handle_action(action_or_state):
             # A valid action was performed.
-            if not self._engine.player.is_alive:
+            engine = self._engine
+            player = self._player
+            if not player.is_alive:
                 # The played was killed some time during or after the action.
-                return GameOverHandler(self._engine)
-            elif self._engine.player.level.requires_level_up:
-                return LevelUpEventHandler(self._engine)
-            return MainEventHandler(self._engine)  # Otherwise return to the main handler.
+                return GameOverHandler(engine)
+            elif player.level.requires_level_up:
+                return LevelUpEventHandler(engine)
+            elif isinstance(self, MainEventHandler):
+                return self  # Already in the main handler, keep it rather than making a new one every turn.
+            return MainEventHandler(engine)  # Otherwise return to the main handler.
         return self
 
     def handle_action(self, action: Optional[Action]) -> bool:
@@ -133,14 +210,15 @@ class EventHandler(BaseEventHandler):
         if action is None:
             return False
 
+        engine = self._engine
         try:
             action.perform()
         except exceptions.Impossible as exc:
-            self._engine.message_log.add_message(exc.args[0], cfg.Color.IMPOSSIBLE)
+            engine.message_log.add_message(exc.args[0], IMPOSSIBLE_COLOR)
             return False  # Skip enemy turn when an action is not possible to perform.
 
-        self._engine.handle_ai()
-        self._engine.update_fov()
+        engine.handle_ai()
+        engine.update_fov()
         return True
 
     @overrides
@@ -150,71 +228,73 @@ class EventHandler(BaseEventHandler):
     @overrides
     def ev_mousemotion(self, event: tcod.event.MouseMotion) -> None:
         """Update the mouse position on mouse motion events."""
-        if self._engine.game_map.in_bounds(event.tile.x, event.tile.y):
-            self._engine.mouse_location = event.tile.x, event.tile.y
+        # Mouse motion is by far the most frequent event, and most of them don't leave the tile the mouse is on.
+        x, y = event.tile
+        engine = self._engine
+        game_map = engine.game_map
+        if 0 <= x < game_map.width and 0 <= y < game_map.height:
+            current_x, current_y = engine.mouse_location
+            if x != current_x or y != current_y:
+                engine.mouse_location = x, y
 
     @property
     def engine(self):
         return self._engine
 
 
+def _quit_game(handler: MainEventHandler, modifier: int) -> NoReturn:
+    raise SystemExit()
+
+
+_KEY_DISPATCH: Dict[int, Callable[[MainEventHandler, int], Optional[ActionOrHandler]]] = {
+    # Key is >, e.g. `shift + <`
+    DOWNSTAIRS_KEY: lambda self, modifier: (
+        actions.StairsAction(self._player)
+        if modifier & _SHIFT_MASK else None
+    ),
+    PICKUP_ITEM_KEY: lambda self, modifier: PickupAction(self._player),
+    # Various menu/info commands
+    SHOW_MESSAGE_HISTORY_KEY: lambda self, modifier: HistoryViewer(self._engine),
+    OPEN_INVENTORY_KEY: lambda self, modifier: InventoryActivateHandler(self._engine),
+    CHARACTER_INFO_KEY: lambda self, modifier: CharacterInfoEventHandler(self._engine),
+    DROP_ITEM_KEY: lambda self, modifier: InventoryDropHandler(self._engine),
+    LOOK_AROUND_KEY: lambda self, modifier: LookHandler(self._engine),
+    SPELL_MENU_KEY: lambda self, modifier: SpellMenuHandler(self._engine),
+    # Other/special
+    DEBUG_CONSOLE_KEY: lambda self, modifier: DebugConsoleHandler(self._engine) if cfg.DEBUG else None,
+    tcod.event.K_ESCAPE: _quit_game,
+}
+"""Commands of the main game state other than movement and waiting, by key. Each entry is called with the active
+MainEventHandler and the key modifiers, and returns the resulting action or handler (if any)."""
+
+
 class MainEventHandler(EventHandler):
+    __slots__ = ()
 
     @overrides
     def ev_keydown(self, event: tcod.event.KeyDown) -> Optional[ActionOrHandler]:
 
-        action: Optional[Action] = None
-
         key = event.sym
-        modifier = event.mod
-        player = self._engine.player
 
         # Movement/action keys
-        if key in MOVE_KEYS:
-            dx, dy = MOVE_KEYS[key]
-            action = BumpAction(player, dx, dy)
-
-        elif key in WAIT_KEYS:
-            action = WaitAction(player)
+        direction = MOVE_KEYS.get(key)
+        if direction is not None:
+            dx, dy = direction
+            return BumpAction(self._player, dx, dy)
 
-        elif key == DOWNSTAIRS_KEY and modifier & (tcod.event.KMOD_LSHIFT | tcod.event.KMOD_RSHIFT):
-            """Key is >, e.g. `shift + <`"""
-            return actions.StairsAction(player)
+        if key in WAIT_KEYS:
+            return WaitAction(self._player)
 
-        # Various menu/info commands
-        elif key == SHOW_MESSAGE_HISTORY_KEY:
-            return HistoryViewer(self._engine)
-
-        elif key == PICKUP_ITEM_KEY:
-            action = PickupAction(player)
-
-        elif key == OPEN_INVENTORY_KEY:
-            return InventoryActivateHandler(self._engine)
-
-        elif key == CHARACTER_INFO_KEY:
-            return CharacterInfoEventHandler(self._engine)
-
-        elif key == DROP_ITEM_KEY:
-            return InventoryDropHandler(self._engine)
-
-        elif key == LOOK_AROUND_KEY:
-            return LookHandler(self._engine)
-
-        elif key == SPELL_MENU_KEY:
-            return SpellMenuHandler(self._engine)
-
-        # Other/special
-        elif cfg.DEBUG and key == DEBUG_CONSOLE_KEY:
-            return DebugConsoleHandler(self._engine)
-
-        elif key == tcod.event.K_ESCAPE:
-            raise SystemExit()
+        command = _KEY_DISPATCH.get(key)
+        if command is not None:
+            return command(self, event.mod)
 
         # No valid key was pressed
-        return action
+        return None
 
 
 class GameOverHandler(EventHandler):
+    __slots__ = ()
 
     @staticmethod
     def _on_quit() -> None:
@@ -235,18 +315,12 @@ class GameOverHandler(EventHandler):
 
 class AskUserEventHandler(EventHandler):
     """Superclass for handling user input for actions which require special input."""
+    __slots__ = ()
 
     @overrides
     def ev_keydown(self, event: tcod.event.KeyDown) -> Optional[ActionOrHandler]:
         """By default, pressing any key will exit this input handler."""
-        if event.sym in {  # Ignore modifier keys.
-            tcod.event.K_LSHIFT,
-            tcod.event.K_RSHIFT,
-            tcod.event.K_LCTRL,
-            tcod.event.K_RCTRL,
-            tcod.event.K_LALT,
-            tcod.event.K_RALT,
-        }:
+        if event.sym in MODIFIER_KEYS:  # Ignore modifier keys.
             return None
         return self.on_exit()
 
@@ -262,26 +336,57 @@ class AskUserEventHandler(EventHandler):
         return MainEventHandler(self._engine)
 
 
-class SpellMenuHandler(AskUserEventHandler):
-    """Handles the user selecting a spell."""
-    title = "Memorized spells"
+class MenuEventHandler(AskUserEventHandler):
+    """
+    Superclass for handlers showing a menu window on top of the game. Nothing shown in a menu can change while it is
+    open (it takes all input until it is closed), so the window is rendered once into its own console and then
+    copied onto the screen every frame.
+    """
+    __slots__ = ("_menu_console",)
+
+    def __init__(self, engine: Engine):
+        super().__init__(engine)
+        self._menu_console: Optional[tcod.Console] = None
 
     @overrides
     def on_render(self, console: tcod.Console) -> None:
         super().on_render(console)
-        num_spells = len(self.engine.player.spellbook.spells)
-        height = max(num_spells + 2, 3)
+        if self._menu_console is None:
+            self._menu_console = self.render_menu()
+        self._menu_console.blit(console, *self.get_menu_position())
+
+    def get_menu_position(self) -> Tuple[int, int]:
+        """Return the (x, y)-position of the menu window on the screen."""
+        raise NotImplementedError()
+
+    def render_menu(self) -> tcod.Console:
+        """Return a new console the size of the menu window, with the menu drawn on it."""
+        raise NotImplementedError()
 
-        x = 0
-        y = 0
-        if self.engine.player.x <= 30:
-            x = 40
 
+class SpellMenuHandler(MenuEventHandler):
+    """Handles the user selecting a spell."""
+    __slots__ = ()
+
+    title = "Memorized spells"
+
+    @overrides
+    def get_menu_position(self) -> Tuple[int, int]:
+        if self._player.x <= 30:
+            return 40, 0
+        return 0, 0
+
+    @overrides
+    def render_menu(self) -> tcod.Console:
+        spells = self._player.spellbook.spells
+        num_spells = len(spells)
+        height = max(num_spells + 2, 3)
         width = len(self.title) + 4
 
-        console.draw_frame(
-            x=x,
-            y=y,
+        menu = tcod.Console(width, height, order="F")
+        menu.draw_frame(
+            x=0,
+            y=0,
             width=width,
             height=height,
             title=self.title,
@@ -291,24 +396,23 @@ class SpellMenuHandler(AskUserEventHandler):
         )
 
         if num_spells > 0:
-            for i, spell in enumerate(self.engine.player.spellbook.spells):
-                spell_key = chr(ord("a") + i)
-                spell_str = f"({spell_key}) {spell.name}"
-                console.print(x + 1, y + i + 1, spell_str)
+            # Print all the entries with a single call, one per line.
+            menu.print(1, 1, "\n".join(MENU_LETTER_PREFIXES[i] + spell.name for i, spell in enumerate(spells)))
         else:
-            console.print(x + 1, y + 1, "(Empty)")
+            menu.print(1, 1, "(Empty)")
+        return menu
 
     @overrides
     def ev_keydown(self, event: tcod.event.KeyDown) -> Optional[ActionOrHandler]:
-        player = self.engine.player
+        player = self._player
         key = event.sym
-        index = key - tcod.event.K_a
+        index = LETTER_KEYS.get(key)
 
-        if 0 <= index <= 26:
+        if index is not None:
             try:
                 selected_spell = player.spellbook.spells[index]
             except IndexError:
-                self._engine.message_log.add_message("Invalid entry.", cfg.Color.INVALID)
+                self._engine.message_log.add_message(INVALID_ENTRY_TEXT, INVALID_COLOR)
                 return None
             return self.on_spell_selected(selected_spell)
 
@@ -319,34 +423,35 @@ class SpellMenuHandler(AskUserEventHandler):
         return spell.get_action()
 
 
-class InventoryEventHandler(AskUserEventHandler):
+class InventoryEventHandler(MenuEventHandler):
     """This handler lets the user select an item. What happens depends on the subclass."""
+    __slots__ = ()
 
     title = "<no title>"
 
     @overrides
-    def on_render(self, console: tcod.Console) -> None:
+    def get_menu_position(self) -> Tuple[int, int]:
         """
-        Render an inventory menu that displays the items in the inventory and the letter to select them.
-        Will move to a different position based on where the player is located, so the player can always see
-        where they are.
+        The inventory menu will move to a different position based on where the player is located, so the player
+        can always see where they are.
         """
-        super().on_render(console)
-        num_items = len(self._engine.player.inventory.items)
-
-        height = max(num_items + 2, 3)
+        if self._player.x <= 30:
+            return 40, 0
+        return 0, 0
 
-        if self._engine.player.x <= 30:
-            x = 40
-        else:
-            x = 0
-        y = 0
+    @overrides
+    def render_menu(self) -> tcod.Console:
+        """Render an inventory menu that displays the items in the inventory and the letter to select them."""
+        items = self._player.inventory.items
+        num_items = len(items)
 
+        height = max(num_items + 2, 3)
         width = len(self.title) + 4
 
-        console.draw_frame(
-            x=x,
-            y=y,
+        menu = tcod.Console(width, height, order="F")
+        menu.draw_frame(
+            x=0,
+            y=0,
             width=width,
             height=height,
             title=self.title,
@@ -356,29 +461,29 @@ class InventoryEventHandler(AskUserEventHandler):
         )
 
         if num_items > 0:
-            for i, item in enumerate(self._engine.player.inventory.items):
-                item_key = chr(ord("a") + i)
-                is_equipped = self.engine.player.equipment.is_item_equipped(item)
-                item_str = f"({item_key}) {item.name}"
-                if is_equipped:
-                    item_str = f"{item_str} (worn)"
-                    console.print(x + 1, y + i + 1, item_str, fg=cfg.Color.GREEN)
-                else:
-                    console.print(x + 1, y + i + 1, item_str)
+            # Print all the entries with a single call, one per line, then print over the few equipped ones in color.
+            lines = [MENU_LETTER_PREFIXES[i] + item.name for i, item in enumerate(items)]
+            menu.print(1, 1, "\n".join(lines))
+
+            is_item_equipped = self._player.equipment.is_item_equipped
+            for i, item in enumerate(items):
+                if is_item_equipped(item):
+                    menu.print(1, i + 1, lines[i] + " (worn)", fg=cfg.Color.GREEN)
         else:
-            console.print(x + 1, y + 1, "(Empty)")
+            menu.print(1, 1, "(Empty)")
+        return menu
 
     @overrides
     def ev_keydown(self, event: tcod.event.KeyDown) -> Optional[ActionOrHandler]:
-        player = self._engine.player
+        player = self._player
         key = event.sym
-        index = key - tcod.event.K_a
+        index = LETTER_KEYS.get(key)
 
-        if 0 <= index <= 26:
+        if index is not None:
             try:
                 selected_item = player.inventory.items[index]
             except IndexError:
-                self._engine.message_log.add_message("Invalid entry.", cfg.Color.INVALID)
+                self._engine.message_log.add_message(INVALID_ENTRY_TEXT, INVALID_COLOR)
                 return None
             return self.on_item_selected(selected_item)
 
@@ -391,6 +496,7 @@ class InventoryEventHandler(AskUserEventHandler):
 
 class InventoryActivateHandler(InventoryEventHandler):
     """Handle using an inventory item."""
+    __slots__ = ()
 
     title = "Select an item to use."
 
@@ -398,31 +504,33 @@ class InventoryActivateHandler(InventoryEventHandler):
     def on_item_selected(self, item: Item) -> Optional[ActionOrHandler]:
         """Return the action for the selected item."""
         if item.consumable:
-            return item.consumable.get_action(self._engine.player)
+            return item.consumable.get_action(self._player)
         elif item.equippable:
-            return actions.EquipAction(self._engine.player, item)
+            return actions.EquipAction(self._player, item)
         else:
             return None
 
 
 class InventoryDropHandler(InventoryEventHandler):
     """Handle dropping an inventory item."""
+    __slots__ = ()
 
     title = "Select an item to drop."
 
     @overrides
     def on_item_selected(self, item: Item) -> Optional[ActionOrHandler]:
         """Drop this item."""
-        return actions.DropItem(self._engine.player, item)
+        return actions.DropItem(self._player, item)
 
 
 class SelectIndexHandler(AskUserEventHandler):
     """Handles asking the user for an index (position) on the game map."""
+    __slots__ = ("_prev_mouse_location",)
 
     def __init__(self, engine: Engine):
         """Set the cursor to the player's position when this handler is constructed."""
         super().__init__(engine)
-        player = self._engine.player
+        player = self._player
         self._prev_mouse_location: Tuple[int, int] = engine.mouse_location
         engine.mouse_location = player.x, player.y
 
@@ -438,23 +546,18 @@ class SelectIndexHandler(AskUserEventHandler):
     def ev_keydown(self, event: tcod.event.KeyDown) -> Optional[ActionOrHandler]:
         """Check for key movement or confirmation keys."""
         key = event.sym
-        if key in MOVE_KEYS:
-            modifier = 1  # Holding modifier keys will result in larger movement shifts.
-            if event.mod & (tcod.event.KMOD_LSHIFT | tcod.event.KMOD_RSHIFT):
-                modifier *= 5
-            if event.mod & (tcod.event.KMOD_LCTRL | tcod.event.KMOD_RCTRL):
-                modifier *= 10
-            if event.mod & (tcod.event.KMOD_LALT | tcod.event.KMOD_RALT):
-                modifier *= 20
+        scaled_moves = MOVE_KEY_SCALED.get(key)
+        if scaled_moves is not None:
+            # Holding modifier keys will result in larger movement shifts.
+            mod = event.mod
+            modifier_index = (
+                (1 if mod & _SHIFT_MASK else 0) | (2 if mod & _CTRL_MASK else 0) | (4 if mod & _ALT_MASK else 0)
+            )
+            dx, dy = scaled_moves[modifier_index]
 
             x, y = self._engine.mouse_location
-            dx, dy = MOVE_KEYS[key]
-            x += dx * modifier
-            y += dy * modifier
-            # Clamp the cursor position (index) to the map size.
-            x = max(0, min(x, self._engine.game_map.width - 1))
-            y = max(0, min(y, self._engine.game_map.height - 1))
-            self._engine.mouse_location = x, y
+            game_map = self._engine.game_map
+            self._engine.mouse_location = _clamp_move(x, y, dx, dy, game_map.width, game_map.height)
             return None
 
         elif key in CONFIRM_KEYS:
@@ -477,6 +580,7 @@ class SelectIndexHandler(AskUserEventHandler):
 
 class LookHandler(SelectIndexHandler):
     """Let the player look around using the keyboard."""
+    __slots__ = ()
 
     @overrides
     def on_index_selected(self, x: int, y: int) -> MainEventHandler:
@@ -487,6 +591,7 @@ class LookHandler(SelectIndexHandler):
 
 class SingleRangedTargetingHandler(SelectIndexHandler):
     """Handles targeting a single entity or actor, e.g. shooting an arrow, a lightning bolt, etc."""
+    __slots__ = ("_callback",)
 
     def __init__(self, engine: Engine, callback: Callable[[Tuple[int, int]], Optional[Action]]):
         super().__init__(engine)
@@ -503,6 +608,7 @@ class AreaRangedTargetingHandler(SelectIndexHandler):
     Handles targeting an area within a given radius, not necessarily containing any entities. Any entity
     within the given radius will be affected.
     """
+    __slots__ = ("_radius", "_callback", "_frame_offset", "_frame_size")
 
     def __init__(
             self,
@@ -513,6 +619,9 @@ class AreaRangedTargetingHandler(SelectIndexHandler):
         super().__init__(engine)
         self._radius = radius
         self._callback = callback
+        # The frame is drawn just outside the targeted area, which spans `radius` tiles on each side of the cursor.
+        self._frame_offset = radius + 1
+        self._frame_size = radius * 2 + 3
 
     @overrides
     def on_render(self, console: tcod.Console) -> None:
@@ -523,10 +632,10 @@ class AreaRangedTargetingHandler(SelectIndexHandler):
 
         # Draw a rectangle around the targeted area so the player can see what will be affected.
         console.draw_frame(
-            x=x - self._radius - 1,
-            y=y - self._radius - 1,
-            width=self._radius ** 2,
-            height=self._radius ** 2,
+            x=x - self._frame_offset,
+            y=y - self._frame_offset,
+            width=self._frame_size,
+            height=self._frame_size,
             fg=cfg.Color.RED,
             clear=False,
         )
@@ -537,20 +646,21 @@ class AreaRangedTargetingHandler(SelectIndexHandler):
         return self._callback((x, y))
 
 
-class CharacterInfoEventHandler(AskUserEventHandler):
+class CharacterInfoEventHandler(MenuEventHandler):
+    __slots__ = ()
 
     @overrides
-    def on_render(self, console: tcod.Console) -> None:
-        super().on_render(console)
-
-        player = self._engine.player
+    def get_menu_position(self) -> Tuple[int, int]:
+        return cfg.CharacterInfoWindow.get_pos_x(self._player.x), cfg.CharacterInfoWindow.POS_Y
 
-        x = cfg.CharacterInfoWindow.get_pos_x(self._engine.player.x)
-        y = cfg.CharacterInfoWindow.POS_Y
+    @overrides
+    def render_menu(self) -> tcod.Console:
+        player = self._player
 
-        console.draw_frame(
-            x=x,
-            y=y,
+        menu = tcod.Console(cfg.CharacterInfoWindow.WIDTH, cfg.CharacterInfoWindow.HEIGHT, order="F")
+        menu.draw_frame(
+            x=0,
+            y=0,
             width=cfg.CharacterInfoWindow.WIDTH,
             height=cfg.CharacterInfoWindow.HEIGHT,
             title=cfg.CharacterInfoWindow.TITLE,
@@ -559,48 +669,52 @@ class CharacterInfoEventHandler(AskUserEventHandler):
             bg=cfg.CharacterInfoWindow.BACKGROUND_COLOR,
         )
 
-        console.print(
-            x=x + 1,
-            y=y + 1,
+        menu.print(
+            x=1,
+            y=1,
             string=f"Current level: {player.level.current_level}"
         )
 
-        console.print(
-            x=x + 1,
-            y=y + 2,
+        menu.print(
+            x=1,
+            y=2,
             string=f"Experience points: {player.level.current_experience}",
         )
 
-        console.print(
-            x=x + 1,
-            y=y + 3,
+        menu.print(
+            x=1,
+            y=3,
             string=f"To next level: {player.level.experience_to_next_level}"
         )
 
-        console.print(
-            x=x + 1,
-            y=y + 5,
+        menu.print(
+            x=1,
+            y=5,
             string=f"Attack power: {player.fighter.power}"
         )
 
-        console.print(
-            x=x + 1,
-            y=y + 6,
+        menu.print(
+            x=1,
+            y=6,
             string=f"Defense: {player.fighter.defense}"
         )
+        return menu
 
 
-class LevelUpEventHandler(AskUserEventHandler):
+class LevelUpEventHandler(MenuEventHandler):
+    __slots__ = ()
 
     @overrides
-    def on_render(self, console: tcod.Console) -> None:
-        super().on_render(console)
-        x = cfg.LevelUpWindow.get_pos_x(self.engine.player.x)  # Position the window so it isn't drawn over the player.
-        y = cfg.LevelUpWindow.POS_Y
+    def get_menu_position(self) -> Tuple[int, int]:
+        # Position the window so it isn't drawn over the player.
+        return cfg.LevelUpWindow.get_pos_x(self._player.x), cfg.LevelUpWindow.POS_Y
 
-        console.draw_frame(
-            x=x,
-            y=y,
+    @overrides
+    def render_menu(self) -> tcod.Console:
+        menu = tcod.Console(cfg.LevelUpWindow.WIDTH, cfg.LevelUpWindow.HEIGHT, order="F")
+        menu.draw_frame(
+            x=0,
+            y=0,
             width=cfg.LevelUpWindow.WIDTH,
             height=cfg.LevelUpWindow.HEIGHT,
             title=cfg.LevelUpWindow.TITLE,
@@ -609,36 +723,37 @@ class LevelUpEventHandler(AskUserEventHandler):
             bg=cfg.LevelUpWindow.BACKGROUND_COLOR,
         )
 
-        console.print(x=x+1, y=y+2, string=cfg.LevelUpWindow.TEXT)
+        menu.print(x=1, y=2, string=cfg.LevelUpWindow.TEXT)
 
-        console.print(
-            x=x+1,
-            y=y+4,
-            string=f"(a) Constitution (increase max health)"
+        menu.print(
+            x=1,
+            y=4,
+            string=LEVEL_UP_OPTION_CONSTITUTION
         )
 
-        console.print(
-            x=x+1,
-            y=y+5,
-            string=f"(b) Strength (increase attack power)",
+        menu.print(
+            x=1,
+            y=5,
+            string=LEVEL_UP_OPTION_STRENGTH,
         )
+        return menu
 
     @overrides
     def ev_keydown(self, event: tcod.event.KeyDown) -> Optional[ActionOrHandler]:
 
-        player = self.engine.player
+        player = self._player
         key = event.sym
-        index = key - tcod.event.K_a
-
-        if 0 <= index <= 1:  # Depends on the number of options, needs to change if options are changed.
-            if index == 0:
-                player.fighter.modify_max_hp(cfg.Experience.LEVEL_UP_HEALTH)
-                player.level.increase_level()
-            elif index == 1:
-                player.fighter.increase_base_power(cfg.Experience.LEVEL_UP_POWER)
-                player.level.increase_level()
+        index = LETTER_KEYS.get(key)
+
+        # Depends on the number of options, needs to change if options are changed.
+        if index == 0:
+            player.fighter.modify_max_hp(cfg.Experience.LEVEL_UP_HEALTH)
+            player.level.increase_level()
+        elif index == 1:
+            player.fighter.increase_base_power(cfg.Experience.LEVEL_UP_POWER)
+            player.level.increase_level()
         else:
-            self.engine.message_log.add_message("Invalid entry.", cfg.Color.INVALID)
+            self._engine.message_log.add_message(INVALID_ENTRY_TEXT, INVALID_COLOR)
             return None
 
         return super().ev_keydown(event)
@@ -649,8 +764,44 @@ class LevelUpEventHandler(AskUserEventHandler):
         return None
 
 
-class HistoryViewer(EventHandler):
+class LogWindowHandler(EventHandler):
+    """Superclass for handlers that show a log in a large framed window on top of the game."""
+    __slots__ = ("_log_console", "_empty_log_tiles")
+
+    title = "<no title>"
+
+    def __init__(self, engine: Engine):
+        super().__init__(engine)
+        self._log_console: Optional[tcod.Console] = None
+        self._empty_log_tiles: Optional[np.ndarray] = None
+
+    def get_log_console(self, console: tcod.Console) -> tcod.Console:
+        """
+        Return the console for the log window drawn on `console`, reset to an empty frame with the title banner.
+        The window console is only created and framed once, after which it is reset by copying back its empty tiles.
+        """
+        width = console.width - 6
+        height = console.height - 6
+        log_console = self._log_console
+        if log_console is None or log_console.width != width or log_console.height != height:
+            log_console = tcod.Console(width, height, order="F")
+
+            # Draw a frame with a custom banner title.
+            log_console.draw_frame(0, 0, width, height)
+            log_console.print_box(0, 0, width, 1, self.title, alignment=tcod.CENTER)
+
+            self._log_console = log_console
+            self._empty_log_tiles = log_console.tiles_rgb.copy()
+        else:
+            log_console.tiles_rgb[...] = self._empty_log_tiles
+        return log_console
+
+
+class HistoryViewer(LogWindowHandler):
     """Show the message/text history on a larger window that can be navigated."""
+    __slots__ = ("_log_length", "_cursor")
+
+    title = "Message history"
 
     def __init__(self, engine: Engine):
         super().__init__(engine)
@@ -661,13 +812,7 @@ class HistoryViewer(EventHandler):
     def on_render(self, console: tcod.Console) -> None:
         super().on_render(console)  # First draw the main game state as the background.
 
-        log_console = tcod.Console(console.width - 6, console.height - 6)
-
-        # Draw a frame with a custom banner title.
-        log_console.draw_frame(0, 0, log_console.width, log_console.height)
-        log_console.print_box(
-            0, 0, log_console.width, 1, "Message history", alignment=tcod.CENTER
-        )
+        log_console = self.get_log_console(console)
 
         # Render the message log using the cursor parameter.
         self._engine.message_log.render_messages(
@@ -676,7 +821,8 @@ class HistoryViewer(EventHandler):
             1,
             log_console.width - 2,
             log_console.height - 2,
-            self._engine.message_log.messages[: self._cursor + 1]
+            self._engine.message_log.messages,
+            self._cursor + 1,
         )
         log_console.blit(console, 3, 3)
 
@@ -684,17 +830,7 @@ class HistoryViewer(EventHandler):
     def ev_keydown(self, event: tcod.event.KeyDown) -> Optional[MainEventHandler]:
         # Conditional movement to get the right feel.
         if event.sym in CURSOR_Y_KEYS:
-            adjust = CURSOR_Y_KEYS[event.sym]
-
-            if adjust < 0 and self._cursor == 0:
-                # Only move from the top to the bottom when you are on the edge.
-                self._cursor = self._log_length - 1
-            elif adjust > 0 and self._cursor == self._log_length - 1:
-                # Same with bottom to top movement.
-                self._cursor = 0
-            else:
-                # Otherwise move while staying clamped to the bounds of the history log.
-                self._cursor = max(0, min(self._cursor + adjust, self._log_length - 1))
+            self._cursor = _scroll_cursor(self._cursor, CURSOR_Y_KEYS[event.sym], self._log_length)
 
         elif event.sym == tcod.event.K_HOME:
             self._cursor = 0  # Move directly to the top message.
@@ -708,17 +844,26 @@ class HistoryViewer(EventHandler):
 
 class PopupMessage(BaseEventHandler):
     """Display a popup text window that disappears when any key is pressed."""
+    __slots__ = ("_parent", "_text", "_dimmed_tiles")
 
     def __init__(self, parent_handler: BaseEventHandler, text: str):
         self._parent = parent_handler
         self._text = text
+        self._dimmed_tiles: Optional[np.ndarray] = None
 
     @overrides
     def on_render(self, console: tcod.Console) -> None:
         """Render the parent and dim the result, then print the message on top."""
-        self._parent.on_render(console)
-        console.tiles_rgb["fg"] //= 8
-        console.tiles_rgb["bg"] //= 8
+        tiles_rgb = console.tiles_rgb
+        if self._dimmed_tiles is None or self._dimmed_tiles.shape != tiles_rgb.shape:
+            self._parent.on_render(console)
+            # Dividing by 8 is a right shift by 3 for the unsigned color bytes, done in place on the console's tiles.
+            np.right_shift(tiles_rgb["fg"], 3, out=tiles_rgb["fg"])
+            np.right_shift(tiles_rgb["bg"], 3, out=tiles_rgb["bg"])
+            # The parent can't change while the popup takes all input, so the dimmed background is reused.
+            self._dimmed_tiles = tiles_rgb.copy()
+        else:
+            tiles_rgb[...] = self._dimmed_tiles
 
         console.print(
             console.width // 2,
@@ -735,7 +880,10 @@ class PopupMessage(BaseEventHandler):
         return self._parent
 
 
-class DebugConsoleHandler(EventHandler):
+class DebugConsoleHandler(LogWindowHandler):
+    __slots__ = ("_log_length", "_typing", "_input_text")
+
+    title = "Debug command line"
 
     def __init__(self, engine: Engine):
         super().__init__(engine)
@@ -746,11 +894,7 @@ class DebugConsoleHandler(EventHandler):
     @overrides
     def on_render(self, console: tcod.Console) -> None:
         super().on_render(console)
-        log_console = tcod.Console(console.width - 6, console.height - 6)
-        log_console.draw_frame(0, 0, log_console.width, log_console.height)
-        log_console.print_box(
-            0, 0, log_console.width, 1, "Debug command line", alignment=tcod.CENTER
-        )
+        log_console = self.get_log_console(console)
 
         self._engine.debug_log.render_messages(
             log_console,
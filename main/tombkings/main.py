@@ -1,16 +1,34 @@
 import copy
 import sys
 import traceback
+from typing import List
 
 import tcod
 
 import setup
-from config import Config as cfg
+from config import Config as cfg, ERROR_COLOR
 
 import exceptions
 import input_handlers
 
 
+def coalesce_mouse_motion(events: List[tcod.event.Event]) -> List[tcod.event.Event]:
+    """
+    Collapse each run of consecutive MouseMotion events into the last event of the run.
+    Only the latest mouse position of a run matters for the handlers, so the motion events before it are just wasted
+    dispatches. Runs are never merged across other events, so every key press or mouse click is still handled with
+    the mouse on the tile it was on when that event happened.
+    """
+    mouse_motion = tcod.event.MouseMotion
+    coalesced: List[tcod.event.Event] = []
+    for event in events:
+        if type(event) is mouse_motion and coalesced and type(coalesced[-1]) is mouse_motion:
+            coalesced[-1] = event  # Replace the earlier motion of the same run.
+        else:
+            coalesced.append(event)
+    return coalesced
+
+
 def main() -> None:
     # Load tiles
     tileset = tcod.tileset.load_tilesheet(
@@ -29,18 +47,24 @@ def main() -> None:
         # order F changes how numpy (which tcod uses) accesses 2D arrays from [y,x] to [x,y]
         root_console = tcod.Console(cfg.SCREEN_WIDTH, cfg.SCREEN_HEIGHT, order="F")
 
+        # These don't change during the game, so look them up once instead of on every frame/event.
+        clear = root_console.clear
+        present = context.present
+        wait = tcod.event.wait
+        convert_event = context.convert_event
+
         try:
             # Game loop
             while True:
                 # Draw things to the screen.
-                root_console.clear()
+                clear()
                 handler.on_render(console=root_console)
-                context.present(root_console)
+                present(root_console)
 
                 # Handle events.
                 try:
-                    for event in tcod.event.wait():
-                        context.convert_event(event)
+                    for event in coalesce_mouse_motion(list(wait())):
+                        convert_event(event)
                         # Update the handling of input based on the event (e.g. opening menu, reading scroll may
                         # change how input should be handled and how things should be drawn to the screen).
                         handler = handler.handle_events(event)
@@ -50,10 +74,10 @@ def main() -> None:
                     if isinstance(handler, input_handlers.EventHandler):
                         err_type, err_val, *_ = sys.exc_info()
                         handler.engine.message_log.add_message(
-                            err.__class__.__name__ + ": " + err.__str__(), cfg.Color.ERROR
+                            err.__class__.__name__ + ": " + err.__str__(), ERROR_COLOR
                         )
                         if cfg.DEBUG:
-                            handler.engine.debug_log.add_message(traceback.format_exc(), cfg.Color.ERROR)
+                            handler.engine.debug_log.add_message(traceback.format_exc(), ERROR_COLOR)
 
         except exceptions.QuitWithoutSaving:
             raise
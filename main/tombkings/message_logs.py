@@ -1,24 +1,42 @@
-from typing import Iterable, List, Reversible, Tuple
-import textwrap
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 import tcod
 
 from config import Config as cfg
 
 
 class Message:
+    __slots__ = ("_plain_text", "_full_text", "_fg", "_count", "_wrapped_lines")
 
     def __init__(self, text: str, fg: Tuple[int, int, int]):
         self._plain_text = text
+        self._full_text = text
         self._fg = fg
         self._count = 1
+        # Wrapped lines of the full text as arrays of codepoints (last line first), keyed by the width they were wrapped
+        # to. Messages are usually drawn at a couple of widths at once, e.g. in the log and in the history viewer.
+        self._wrapped_lines: Dict[int, List[np.ndarray]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Leave the wrap cache out of saves, it is rebuilt when the message is rendered."""
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["_wrapped_lines"] = {}
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a pickled message. Saves from before messages had slots hold their old attribute dict instead, which
+        lacks the full text and the wrap cache, so those are rebuilt when missing.
+        """
+        self._plain_text = state["_plain_text"]
+        self._fg = state["_fg"]
+        self.count = state["_count"]  # Also sets the full text and an empty wrap cache.
 
     @property
     def full_text(self) -> str:
         """The full text of this message, including the count if necessary."""
-        if self._count > 1:
-            return f"{self._plain_text} (x{self._count})"
-        return self._plain_text
+        return self._full_text
 
     @property
     def plain_text(self):
@@ -31,6 +49,23 @@ class Message:
     @count.setter
     def count(self, value):
         self._count = value
+        self._full_text = f"{self._plain_text} (x{value})" if value > 1 else self._plain_text
+        self._wrapped_lines = {}  # The full text changed, so it has to be wrapped again.
+
+    def reversed_lines(self, width: int) -> List[np.ndarray]:
+        """
+        Return the full text wrapped to `width` as arrays of unicode codepoints, starting from the last line.
+        Cached per width until the text changes, so the text is only wrapped and encoded again when it has to be.
+        """
+        lines = self._wrapped_lines.get(width)
+        if lines is None:
+            lines = [
+                np.frombuffer(line.encode("utf-32-le"), dtype=np.int32)
+                for line in MessageLog.wrap(self.full_text, width)
+            ]
+            lines.reverse()
+            self._wrapped_lines[width] = lines
+        return lines
 
     @property
     def fg(self):
@@ -83,19 +118,35 @@ class MessageLog:
             y: int,
             width: int,
             height: int,
-            messages: Reversible[Message],
+            messages: Sequence[Message],
+            end: Optional[int] = None,
     ) -> None:
         """
         Render the messages provided. The messages are rendered starting from the last and working backwards.
-        :param console: The console to draw upon
+        :param console: The console to draw upon, indexed [x, y] (i.e. created with order="F").
         :param x, y, width, height: The rectangular region to render on.
         :param messages: The list of messages.
+        :param end: If given, only the messages before this index are rendered (the one at `end - 1` is the last).
         """
-        y_offset = height - 1
+        # Write the characters and colors of each line straight into the console's tiles, which is a lot cheaper than
+        # going through console.print for every line.
+        tiles = console.tiles_rgb
+        tiles_ch = tiles["ch"]
+        tiles_fg = tiles["fg"]
 
-        for msg in reversed(messages):
-            for line in reversed(list(cls.wrap(msg.full_text, width))):
-                console.print(x=x, y=y+y_offset, string=line, fg=msg.fg)
+        y_offset = height - 1
+        if end is None:
+            end = len(messages)
+
+        # Walk back from the end by index, so only the messages that fit in the area are ever looked at or wrapped,
+        # however long the log is.
+        for i in range(end - 1, -1, -1):
+            msg = messages[i]
+            fg = msg.fg
+            for line in msg.reversed_lines(width):
+                line_end = x + len(line)
+                tiles_ch[x:line_end, y + y_offset] = line
+                tiles_fg[x:line_end, y + y_offset] = fg
                 y_offset -= 1
                 if y_offset < 0:
                     return  # No more space to print messages.
@@ -104,9 +155,44 @@ class MessageLog:
     def wrap(string: str, width: int) -> Iterable[str]:
         """Return a wrapped text message."""
         for line in string.splitlines():  # Handle newlines in message.
-            yield from textwrap.wrap(
-                line, width, expand_tabs=True,
-            )
+            yield from MessageLog.wrap_line(line.expandtabs(), width)
+
+    @staticmethod
+    def wrap_line(line: str, width: int) -> Iterable[str]:
+        """
+        Greedily wrap a single line of text to `width` characters, like textwrap.wrap but without its regex machinery.
+        Every character takes up one console cell, so a word fits as long as the line length plus the word length do.
+        Whitespace at the start of wrapped lines and at the end of all lines is dropped, and words longer than `width`
+        are broken up. Unlike textwrap, words are never broken on hyphens.
+        """
+        current = ""
+        gap = 0  # Number of spaces before the next word.
+        for word in line.split(" "):
+            if not word:
+                gap += 1
+                continue
+            if current and len(current) + gap + len(word) > width:
+                if len(word) > width and len(current) + gap < width:
+                    # Fill the rest of the line with the start of a word that is too long for any line.
+                    space_left = width - len(current) - gap
+                    current += " " * gap + word[:space_left]
+                    word = word[space_left:]
+                yield current
+                current = ""
+                gap = 0
+            if current:
+                current += " " * gap + word
+            else:
+                gap %= width  # Drop whole lines of indentation, like textwrap, so no line is only spaces.
+                if gap + len(word) > width >= len(word):
+                    gap = 0  # Drop indentation that would push a word which fits on a line of its own over the edge.
+                current = " " * gap + word
+                while len(current) > width:
+                    yield current[:width]
+                    current = current[width:]
+            gap = 1
+        if current:
+            yield current
 
     @property
     def messages(self):
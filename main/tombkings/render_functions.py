@@ -2,13 +2,20 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Tuple
 
+import numpy as np
+
 from config import Config as cfg
+from tile_types import graphic_dt
 
 if TYPE_CHECKING:
     from tcod import Console
     from engine import Engine
     from game_map import GameMap
 
+# The tiles of the health bar, as drawn by `draw_rect` with ch=1 on a cleared console (which has a white foreground).
+_EMPTY_BAR_TILE = np.array((1, cfg.Color.WHITE, cfg.Color.BAR_EMPTY), dtype=graphic_dt)
+_FILLED_BAR_TILE = np.array((1, cfg.Color.WHITE, cfg.Color.BAR_FILLED), dtype=graphic_dt)
+
 
 def render_bar(
         console: Console,
@@ -17,27 +24,20 @@ def render_bar(
         total_width: int,
 ) -> None:
 
-    bar_width = int(float(current_value) / max_value * total_width)
+    # Fill the bar's tiles directly from the prebuilt tiles rather than through draw_rect.
+    x = cfg.HealthBar.POS_X
+    y = cfg.HealthBar.POS_Y
+    tiles = console.tiles_rgb
+    tiles[x:x + cfg.HealthBar.WIDTH, y:y + cfg.HealthBar.HEIGHT] = _EMPTY_BAR_TILE
+
+    if max_value <= 0:
+        return  # Nothing to fill.
 
-    console.draw_rect(
-        x=cfg.HealthBar.POS_X,
-        y=cfg.HealthBar.POS_Y,
-        width=cfg.HealthBar.WIDTH,
-        height=cfg.HealthBar.HEIGHT,
-        ch=1,
-        bg=cfg.Color.BAR_EMPTY
-    )
+    bar_width = current_value * total_width // max_value
 
     if bar_width > 0:
 
-        console.draw_rect(
-            x=cfg.HealthBar.POS_X,
-            y=cfg.HealthBar.POS_Y,
-            width=bar_width,
-            height=1,
-            ch=1,
-            bg=cfg.Color.BAR_FILLED
-        )
+        tiles[x:x + bar_width, y] = _FILLED_BAR_TILE
 
         console.print(
             x=cfg.HealthBar.POS_X + 1,
@@ -70,8 +70,4 @@ def _get_names_at(x: int, y: int, game_map: GameMap) -> str:
     if not game_map.in_bounds(x, y) or not game_map.visible_tiles[x, y]:
         return ""
 
-    names = ", ".join(
-        entity.name for entity in game_map.entities if entity.x == x and entity.y == y
-    )
-
-    return names.capitalize()
\ No newline at end of file
+    return game_map.get_names_at(x, y)
\ No newline at end of file
@@ -5,8 +5,10 @@ import copy
 import lzma
 import pickle
 import traceback
-from typing import Optional
+import zlib
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import tcod
 from overrides import overrides
 
@@ -16,9 +18,25 @@ from entity_factories import EntityFactory
 import input_handlers
 from game_map import GameWorld
 
+LZMA_MAGIC = b"\xfd7zXZ\x00"
+"""Saves start with this when they were compressed with lzma, which was used before switching to zlib."""
+
 # Load the background image and remove the alpha channel.
 background_image = tcod.image.load("assets/menu_background1.png")[:, :, :3]
 
+_background_tiles: Dict[Tuple[int, int], np.ndarray] = {}
+"""The background image drawn as semigraphics on an empty console, keyed by the console's (width, height)."""
+
+
+def _get_background_tiles(width: int, height: int) -> np.ndarray:
+    """Return the tiles of an empty [x, y]-ordered console of the given size with the background image drawn on it."""
+    tiles = _background_tiles.get((width, height))
+    if tiles is None:
+        scratch = tcod.Console(width, height, order="F")
+        scratch.draw_semigraphics(background_image, 0, 0)
+        tiles = _background_tiles[width, height] = scratch.tiles_rgb.copy()
+    return tiles
+
 
 def new_game() -> Engine:
     """Return a brand new game session as an engine instance."""
@@ -56,7 +74,12 @@ def save_game(handler: input_handlers.BaseEventHandler, file_name: str) -> None:
 def load_game(file_name: str) -> Engine:
     """Load an Engine instance from a file."""
     with open(file_name, "rb") as f:
-        engine = pickle.loads(lzma.decompress(f.read()))
+        save_data = f.read()
+    if save_data.startswith(LZMA_MAGIC):
+        save_data = lzma.decompress(save_data)
+    else:
+        save_data = zlib.decompress(save_data)
+    engine = pickle.loads(save_data)
     assert isinstance(engine, Engine)
     return engine
 
@@ -65,11 +88,13 @@ class MainMenu(input_handlers.BaseEventHandler):
     """Handle the main menu rendering and input. This input handler is specific to the start of the game and
     is therefore not among the others in input_handlers.py. This handler will not be called during the normal
     course of the game."""
+    __slots__ = ()
 
     @overrides
     def on_render(self, console: tcod.Console) -> None:
         """Render the main menu on a background image."""
-        console.draw_semigraphics(background_image, 0, 0)
+        # The image never changes, so copy the tiles it was drawn to once instead of resampling it every frame.
+        console.tiles_rgb[...] = _get_background_tiles(console.width, console.height)
 
         console.print(
             console.width // 2,
@@ -0,0 +1,64 @@
+"""Check how message text is wrapped to fit the log."""
+import os
+import sys
+import textwrap
+import unittest
+
+# The game uses flat imports and loads its assets relative to its own directory.
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+os.chdir(GAME_DIR)
+
+from message_logs import MessageLog  # noqa: E402
+
+
+def wrap_line(line: str, width: int):
+    return list(MessageLog.wrap_line(line, width))
+
+
+class TestWrapLine(unittest.TestCase):
+
+    def test_words_fill_lines_greedily(self) -> None:
+        text = "You hit the orc for 3 damage, and it falls to the floor with a thud."
+        for width in (10, 20, 31, 80):
+            self.assertEqual(wrap_line(text, width), textwrap.wrap(text, width))
+
+    def test_line_that_fits(self) -> None:
+        self.assertEqual(wrap_line("abc def", 7), ["abc def"])
+
+    def test_empty_line(self) -> None:
+        self.assertEqual(wrap_line("", 5), [])
+        self.assertEqual(wrap_line("    ", 5), [])
+
+    def test_long_words_are_broken_up(self) -> None:
+        self.assertEqual(wrap_line("abcdefghij", 4), ["abcd", "efgh", "ij"])
+        self.assertEqual(wrap_line("ab cdefghij", 4), ["ab c", "defg", "hij"])
+
+    def test_whitespace_at_line_ends_is_dropped(self) -> None:
+        self.assertEqual(wrap_line("ab   cd  ", 3), ["ab", "cd"])
+        self.assertEqual(wrap_line("ab    cd", 4), ["ab", "cd"])
+
+    def test_indentation_is_kept_on_the_first_line(self) -> None:
+        self.assertEqual(wrap_line("  ab cd", 5), ["  ab", "cd"])
+
+    def test_indentation_never_makes_a_blank_line(self) -> None:
+        self.assertEqual(wrap_line("      abcdefgh", 4), ["  ab", "cdef", "gh"])
+        self.assertEqual(wrap_line("    abcdefgh", 4), ["abcd", "efgh"])
+        self.assertEqual(wrap_line("     abc", 3), ["abc"])
+        for indent in range(12):
+            for width in range(1, 6):
+                for word in ("a", "abc", "abcdefgh"):
+                    lines = wrap_line(" " * indent + word + " b", width)
+                    self.assertTrue(all(line.strip() for line in lines), (indent, width, word, lines))
+
+    def test_words_are_not_broken_on_hyphens(self) -> None:
+        self.assertEqual(wrap_line("well-known", 6), ["well-k", "nown"])
+        self.assertEqual(wrap_line("a well-known", 10), ["a", "well-known"])
+
+    def test_wrap_handles_newlines_and_tabs(self) -> None:
+        self.assertEqual(list(MessageLog.wrap("ab cd\nef", 3)), ["ab", "cd", "ef"])
+        self.assertEqual(list(MessageLog.wrap("a\tb", 20)), ["a       b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
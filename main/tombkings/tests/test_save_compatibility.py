@@ -0,0 +1,60 @@
+"""Check that games saved before the save format changes can still be loaded and played."""
+import os
+import sys
+import tempfile
+import unittest
+
+# The game uses flat imports and loads its assets relative to its own directory.
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+os.chdir(GAME_DIR)
+
+import tcod  # noqa: E402
+
+from config import Config as cfg  # noqa: E402
+import input_handlers  # noqa: E402
+import setup  # noqa: E402
+
+BASELINE_SAVE = os.path.join(GAME_DIR, "tests", "data", "baseline_savegame.sav")
+"""
+A game saved by the version from before messages and the ticker got slots (lzma compressed, with the ticker's
+`_schedule` dict), after a few turns and with a stacked "Stacked message" as the last message.
+"""
+
+
+class TestBaselineSave(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.engine = setup.load_game(BASELINE_SAVE)
+
+    def test_messages(self) -> None:
+        last_message = self.engine.message_log.messages[-1]
+        self.assertEqual(last_message.count, 2)
+        self.assertEqual(last_message.full_text, "Stacked message (x2)")
+
+    def test_ticker(self) -> None:
+        ticker = self.engine.ticker
+        next_tick = ticker.peek_next_tick()
+        self.assertIsNotNone(next_tick)
+        self.assertGreaterEqual(next_tick, ticker.ticks)
+
+    def test_render_and_play(self) -> None:
+        console = tcod.Console(cfg.SCREEN_WIDTH, cfg.SCREEN_HEIGHT, order="F")
+        handler: input_handlers.BaseEventHandler = input_handlers.MainEventHandler(self.engine)
+        wait = tcod.event.KeyDown(scancode=0, sym=tcod.event.K_PERIOD, mod=0)
+        for _ in range(5):
+            handler.on_render(console)
+            handler = handler.handle_events(wait)
+        handler.on_render(console)
+
+    def test_save_again(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "savegame.sav")
+            self.engine.save_as(file_name)
+            engine = setup.load_game(file_name)
+        self.assertEqual((engine.player.x, engine.player.y), (self.engine.player.x, self.engine.player.y))
+        self.assertEqual(engine.message_log.messages[-1].full_text, "Stacked message (x2)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,20 +1,55 @@
-from typing import List, Dict
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
 
 from entity import Actor
 
 
 class Ticker:
     """Simple time scheduling system."""
+    __slots__ = ("_ticks", "_heap", "_seq")
 
     def __init__(self):
         self._ticks = 0
-        self._schedule: Dict[int, List[Actor]] = {}
+        # Scheduled turns as (tick, sequence number, actor). The sequence number keeps actors scheduled for the same
+        # tick in the order they were scheduled, and means actors are never compared.
+        self._heap: List[Tuple[int, int, Actor]] = []
+        self._seq = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled ticker, from either its slots or the attribute dict of saves from before it had slots."""
+        self._ticks = state["_ticks"]
+        if "_heap" in state:
+            self._heap = state["_heap"]
+            self._seq = state["_seq"]
+        else:
+            # Older saves keep a dict of {tick: [actors in the order they were scheduled]}. Number the actors tick by
+            # tick in that order, so the heap hands them out the same way the dict would have.
+            self._heap = []
+            self._seq = 0
+            for tick in sorted(state["_schedule"]):
+                for actor in state["_schedule"][tick]:
+                    self._heap.append((tick, self._seq, actor))
+                    self._seq += 1
+            heapq.heapify(self._heap)
 
     def schedule_turn(self, interval, actor: Actor):
-        self._schedule.setdefault(self._ticks + interval, []).append(actor)
-
-    def next_turn(self):
-        return self._schedule.pop(self._ticks, [])
+        heapq.heappush(self._heap, (self._ticks + interval, self._seq, actor))
+        self._seq += 1
+
+    def next_turn(self) -> List[Actor]:
+        """Return the actors scheduled for the current tick (or earlier), in the order they were scheduled."""
+        heap = self._heap
+        actors = []
+        while heap and heap[0][0] <= self._ticks:
+            actors.append(heapq.heappop(heap)[2])
+        return actors
+
+    def peek_next_tick(self) -> Optional[int]:
+        """Return the tick of the earliest scheduled turn, or None if nothing is scheduled."""
+        return self._heap[0][0] if self._heap else None
 
     @property
     def ticks(self):
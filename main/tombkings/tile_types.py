@@ -16,8 +16,8 @@ graphic_dt = np.dtype(
 
 tile_dt = np.dtype(
     [
-        ("walkable", np.bool),  # True if tile can be walked over
-        ("transparent", np.bool),  # True if tile does not block vision
+        ("walkable", bool),  # True if tile can be walked over
+        ("transparent", bool),  # True if tile does not block vision
         ("dark", graphic_dt),  # Graphic for when tile is not in field of vision
         ("light", graphic_dt),  # Graphics for when the tile is in field of vision
     ]
@@ -57,4 +57,27 @@ DOWN_STAIRS = new_tile(
 )
 
 # SHROUD represents unexplored tiles not in field of vision.
-SHROUD = np.array((ord(" "), (255, 255, 255), (0, 0, 0)), dtype=graphic_dt)
\ No newline at end of file
+SHROUD = np.array((ord(" "), (255, 255, 255), (0, 0, 0)), dtype=graphic_dt)
+
+# Lookup table of the tile types, so that a whole map can be built from an array of indices into it in one go,
+# e.g. `TILES[indices]`. The indices are small enough to fit in an np.int8 array.
+
+FLOOR_INDEX = 0
+WALL_INDEX = 1
+DOWN_STAIRS_INDEX = 2
+
+TILES = np.stack([FLOOR, WALL, DOWN_STAIRS])
+
+# The tile constants are shared by every map, make sure they are never modified in place.
+for _tile in (FLOOR, WALL, DOWN_STAIRS, SHROUD, TILES):
+    _tile.setflags(write=False)
+del _tile
+
+# The table seen as opaque blocks of bytes. NumPy copies structured values field by field, while plain bytes are
+# copied in one go, which makes building a map from indices several times faster.
+_TILES_BYTES = TILES.view(np.dtype((np.void, tile_dt.itemsize)))
+
+
+def fill_tiles(tiles: np.ndarray, indices: np.ndarray) -> None:
+    """Set every tile in `tiles` to the tile type in TILES at the same position in `indices`."""
+    np.take(_TILES_BYTES, indices, out=tiles.view(_TILES_BYTES.dtype))
\ No newline at end of file